@@ -1,5 +1,6 @@
 import importlib
 import os
+import warnings
 
 import pytest
 import test_models as TM
@@ -249,6 +250,20 @@ class TestHandleLegacyInterface:
             with pytest.warns(UserWarning, match="deprecated"):
                 builder(**{pretrained_param: True})
 
+    def test_warn_every_call(self):
+        @handle_legacy_interface(weights=("pretrained", self.ModelWeights.Sentinel))
+        def builder(*, weights=None):
+            pass
+
+        # A warning that was filtered out once must not silence the following calls
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            builder(pretrained=True)
+
+        for _ in range(2):
+            with pytest.warns(UserWarning, match="deprecated"):
+                builder(pretrained=True)
+
     def test_default_callable(self):
         @handle_legacy_interface(
             weights=(
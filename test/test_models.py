@@ -4,6 +4,7 @@ import operator
 import os
 import pkgutil
 import sys
+import threading
 import warnings
 from collections import OrderedDict
 from tempfile import TemporaryDirectory
@@ -451,6 +452,184 @@ def test_mobilenet_norm_layer(model_fn):
     assert any(isinstance(x, nn.GroupNorm) for x in model.modules())
 
 
+def test_efficientnet_conf_cache():
+    efficientnet = models.efficientnet
+    first, _ = efficientnet._efficientnet_conf("efficientnet_b0", width_mult=1.0, depth_mult=1.0)
+    expected_num_layers = first[0].num_layers
+
+    first[0].num_layers += 1
+    first[0].block = nn.Identity
+
+    second, _ = efficientnet._efficientnet_conf("efficientnet_b0", width_mult=1.0, depth_mult=1.0)
+    cached, _ = efficientnet._cached_efficientnet_conf("efficientnet_b0", 1.0, 1.0)
+    for cnf in (second[0], cached[0]):
+        assert cnf.num_layers == expected_num_layers
+        assert cnf.block is efficientnet.MBConv
+
+
+@pytest.mark.parametrize("model_fn", [models.efficientnet_b0, models.efficientnet_v2_s])
+def test_efficientnet_memory_format(model_fn):
+    model = model_fn(memory_format=torch.channels_last)
+    model.eval()
+    convs = [m for m in model.modules() if isinstance(m, nn.Conv2d)]
+    assert all(m.weight.is_contiguous(memory_format=torch.channels_last) for m in convs)
+
+    x = torch.rand(1, 3, 64, 64).to(memory_format=torch.channels_last)
+    out = model(x)
+    assert out.shape[-1] == 1000
+
+
+@pytest.mark.parametrize("dev", cpu_and_gpu())
+def test_efficientnet_device_dtype(dev):
+    model = models.efficientnet_b0(device=dev, dtype=torch.float64)
+    model.eval()
+    assert all(p.dtype == torch.float64 and p.device.type == dev for p in model.parameters())
+
+    x = torch.rand(1, 3, 64, 64, dtype=torch.float64, device=dev)
+    out = model(x)
+    assert out.dtype == torch.float64
+    assert out.shape[-1] == 1000
+
+
+def test_efficientnet_transforms_not_shared():
+    weights = models.EfficientNet_B1_Weights.IMAGENET1K_V1
+    assert weights.transforms() is not weights.transforms()
+
+
+def test_efficientnet_state_dict(mocker):
+    download = mocker.patch("torchvision.models._api.load_state_dict_from_url", side_effect=AssertionError)
+
+    model = models.efficientnet_b0()
+    model.eval()
+    loaded_model = models.efficientnet_b0(
+        weights=models.EfficientNet_B0_Weights.IMAGENET1K_V1, state_dict=model.state_dict()
+    )
+    loaded_model.eval()
+
+    x = torch.rand(1, 3, 64, 64)
+    torch.testing.assert_close(loaded_model(x), model(x), rtol=0, atol=0)
+    download.assert_not_called()
+
+
+def test_efficientnet_for_inference():
+    model = models.efficientnet_b0(for_inference=True)
+    assert not model.training
+    assert not any(p.requires_grad for p in model.parameters())
+
+    out = model(torch.rand(1, 3, 64, 64))
+    assert out.grad_fn is None
+
+
+@pytest.mark.skipif(
+    "fbgemm" not in torch.backends.quantized.supported_engines,
+    reason="This Pytorch Build has not been built with fbgemm",
+)
+def test_efficientnet_quantize():
+    model = models.efficientnet_b0(quantize=True, calibration_data=torch.rand(1, 3, 64, 64))
+    assert any(isinstance(m, torch.nn.quantized.Conv2d) for m in model.modules())
+
+    out = model(torch.rand(1, 3, 64, 64))
+    assert out.shape[-1] == 1000
+
+
+@pytest.mark.skipif(hasattr(torch, "compile"), reason="This PyTorch version provides torch.compile")
+def test_efficientnet_compile_unavailable(mocker):
+    download = mocker.patch("torchvision.models._api.load_state_dict_from_url")
+    with pytest.raises(RuntimeError, match="torch.compile"):
+        models.efficientnet_b0(weights=models.EfficientNet_B0_Weights.IMAGENET1K_V1, compile=True)
+    download.assert_not_called()
+
+
+def test_efficientnet_init_weights_skipped(mocker):
+    state_dict = models.efficientnet_b0().state_dict()
+    kaiming_normal = mocker.patch("torch.nn.init.kaiming_normal_")
+
+    models.efficientnet_b0(state_dict=state_dict, init_weights=True)
+    kaiming_normal.assert_not_called()
+
+    models.efficientnet_b0()
+    kaiming_normal.assert_called()
+
+
+def test_efficientnet_checkpoint_download(mocker):
+    state_dict = models.efficientnet_b0().state_dict()
+    download_threads = []
+
+    def download(*args, **kwargs):
+        download_threads.append(threading.get_ident())
+        return state_dict
+
+    mocker.patch("torchvision.models._api.load_state_dict_from_url", side_effect=download)
+    model = models.efficientnet_b0(weights=models.EfficientNet_B0_Weights.IMAGENET1K_V1)
+
+    assert len(download_threads) == 1
+    assert download_threads[0] != threading.get_ident()
+    for name, tensor in model.state_dict().items():
+        torch.testing.assert_close(tensor, state_dict[name], rtol=0, atol=0)
+
+
+def test_efficientnet_checkpoint_download_construction_error(mocker):
+    release = threading.Event()
+
+    def download(*args, **kwargs):
+        release.wait(timeout=60)
+        raise RuntimeError("download failed")
+
+    def broken_norm_layer(num_features):
+        raise ValueError("broken norm layer")
+
+    mocker.patch("torchvision.models._api.load_state_dict_from_url", side_effect=download)
+    try:
+        # the construction error surfaces right away, without waiting for the download
+        with pytest.raises(ValueError, match="broken norm layer"):
+            models.efficientnet_b0(weights=models.EfficientNet_B0_Weights.IMAGENET1K_V1, norm_layer=broken_norm_layer)
+    finally:
+        release.set()
+
+
+@pytest.mark.parametrize("dev", cpu_and_gpu())
+def test_efficientnet_checkpoint_map_location(mocker, dev):
+    state_dict = models.efficientnet_b0().state_dict()
+    download = mocker.patch("torchvision.models._api.load_state_dict_from_url", return_value=state_dict)
+
+    model = models.efficientnet_b0(weights=models.EfficientNet_B0_Weights.IMAGENET1K_V1, device=dev)
+
+    download.assert_called_once()
+    assert download.call_args[1]["map_location"] == dev
+    assert all(p.device.type == dev for p in model.parameters())
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork")
+def test_efficientnet_checkpoint_download_after_fork():
+    efficientnet = models.efficientnet
+    assert efficientnet._get_io_pool().submit(int, 1).result() == 1
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            exit_code = 0 if efficientnet._get_io_pool().submit(int, 2).result(timeout=10) == 2 else 1
+        except BaseException:
+            exit_code = 1
+        os._exit(exit_code)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+
+
+def test_efficientnet_scripted():
+    x = torch.rand(1, 3, 64, 64)
+
+    set_rng_seed(0)
+    model = models.efficientnet_b0()
+    model.eval()
+    expected = model(x)
+
+    set_rng_seed(0)
+    scripted_model = models.efficientnet_b0(scripted=True)
+    assert isinstance(scripted_model, torch.jit.ScriptModule)
+    torch.testing.assert_close(scripted_model(x), expected, rtol=1e-4, atol=1e-4)
+
+
 def test_inception_v3_eval():
     kwargs = {}
     kwargs["transform_input"] = True
@@ -19,6 +19,7 @@ from PIL import Image
 from torchvision import transforms as T
 from torchvision.transforms import InterpolationMode
 from torchvision.transforms import functional as F
+from torchvision.transforms._presets import ImageClassification
 from torchvision.transforms.autoaugment import _apply_op
 
 NEAREST, BILINEAR, BICUBIC = InterpolationMode.NEAREST, InterpolationMode.BILINEAR, InterpolationMode.BICUBIC
@@ -981,3 +982,23 @@ def test_gaussian_blur(device, channels, meth_kwargs):
         agg_method="max",
         tol=tol,
     )
+
+
+@pytest.mark.parametrize("device", cpu_and_gpu())
+def test_image_classification_preset(device):
+    mean, std = (0.485, 0.456, 0.406), (0.229, 0.224, 0.225)
+    preset = ImageClassification(crop_size=32, resize_size=32, mean=mean, std=std)
+
+    # resizing and cropping are no-ops for this size, so the preset receives the caller's float tensor
+    float_img = torch.rand(3, 32, 32, device=device)
+    original = float_img.clone()
+    out = preset(float_img)
+    assert_equal(float_img, original)
+    assert_equal(out, F.normalize(original, mean=list(mean), std=list(std)))
+
+    uint8_img = torch.randint(0, 256, (3, 48, 40), dtype=torch.uint8, device=device)
+    expected = F.resize(uint8_img, [32], interpolation=BILINEAR)
+    expected = F.center_crop(expected, [32])
+    expected = F.convert_image_dtype(expected, torch.float)
+    expected = F.normalize(expected, mean=list(mean), std=list(std))
+    assert_equal(preset(uint8_img), expected)
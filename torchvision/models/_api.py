@@ -4,7 +4,7 @@ import sys
 from collections import OrderedDict
 from dataclasses import dataclass, fields
 from inspect import signature
-from typing import Any, Callable, Dict, cast
+from typing import Any, Callable, Mapping, cast
 
 from torchvision._utils import StrEnum
 
@@ -14,7 +14,7 @@ from .._internally_replaced_utils import load_state_dict_from_url
 __all__ = ["WeightsEnum", "Weights", "get_weight"]
 
 
-@dataclass
+@dataclass(frozen=True)
 class Weights:
     """
     This class is used to group important attributes associated with the pre-trained weights.
@@ -25,15 +25,18 @@ class Weights:
             needed to use the model. The reason we attach a constructor method rather than an already constructed
             object is because the specific object might have memory and thus we want to delay initialization until
             needed.
-        meta (Dict[str, Any]): Stores meta-data related to the weights of the model and its configuration. These can be
-            informative attributes (for example the number of parameters/flops, recipe link/methods used in training
-            etc), configuration parameters (for example the `num_classes`) needed to construct the model or important
-            meta-data (for example the `classes` of a classification model) needed to use the model.
+        meta (Mapping[str, Any]): Stores meta-data related to the weights of the model and its configuration. These
+            can be informative attributes (for example the number of parameters/flops, recipe link/methods used in
+            training etc), configuration parameters (for example the `num_classes`) needed to construct the model or
+            important meta-data (for example the `classes` of a classification model) needed to use the model.
     """
 
     url: str
     transforms: Callable
-    meta: Dict[str, Any]
+    meta: Mapping[str, Any]
+
+
+_WEIGHTS_FIELDS = frozenset(f.name for f in fields(Weights))
 
 
 class WeightsEnum(StrEnum):
@@ -60,17 +63,17 @@ class WeightsEnum(StrEnum):
                 )
         return obj
 
-    def get_state_dict(self, progress: bool) -> OrderedDict:
-        return load_state_dict_from_url(self.url, progress=progress)
+    def get_state_dict(self, progress: bool, **kwargs: Any) -> OrderedDict:
+        # the keyword arguments, e.g. map_location, are forwarded to load_state_dict_from_url
+        return load_state_dict_from_url(self.url, progress=progress, **kwargs)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}.{self._name_}"
 
     def __getattr__(self, name):
         # Be able to fetch Weights attributes directly
-        for f in fields(Weights):
-            if f.name == name:
-                return object.__getattribute__(self.value, name)
+        if name in _WEIGHTS_FIELDS:
+            return object.__getattribute__(self.value, name)
         return super().__getattr__(name)
 
 
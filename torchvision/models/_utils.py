@@ -147,6 +147,8 @@ W = TypeVar("W", bound=WeightsEnum)
 M = TypeVar("M", bound=nn.Module)
 V = TypeVar("V")
 
+_SENTINEL = object()
+
 
 def handle_legacy_interface(**weights: Tuple[str, Union[Optional[W], Callable[[Dict[str, Any]], Optional[W]]]]):
     """Decorates a model builder with the new interface to make it compatible with the old.
@@ -174,8 +176,7 @@ def handle_legacy_interface(**weights: Tuple[str, Union[Optional[W], Callable[[D
                 # If neither the weights nor the pretrained parameter as passed, or the weights argument already use
                 # the new style arguments, there is nothing to do. Note that we cannot use `None` as sentinel for the
                 # weight argument, since it is a valid value.
-                sentinel = object()
-                weights_arg = kwargs.get(weights_param, sentinel)
+                weights_arg = kwargs.get(weights_param, _SENTINEL)
                 if (
                     (weights_param not in kwargs and pretrained_param not in kwargs)
                     or isinstance(weights_arg, WeightsEnum)
@@ -188,7 +189,7 @@ def handle_legacy_interface(**weights: Tuple[str, Union[Optional[W], Callable[[D
                 # `kwargs[weights_param]`. This happens because the @kwonly_to_pos_or_kw decorator uses the current
                 # signature to infer the names of positionally passed arguments and thus has no knowledge that there
                 # used to be a pretrained parameter.
-                pretrained_positional = weights_arg is not sentinel
+                pretrained_positional = weights_arg is not _SENTINEL
                 if pretrained_positional:
                     # We put the pretrained argument under its legacy name in the keyword argument dictionary to have a
                     # unified access to the value if the default value is a callable.
@@ -1,9 +1,14 @@
 import copy
+import inspect
 import math
+import os
+import threading
 import warnings
+from collections import ChainMap
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from functools import partial
-from typing import Any, Callable, Optional, List, Sequence, Tuple, Union
+from functools import lru_cache, partial
+from typing import Any, Callable, Optional, List, Mapping, Sequence, Tuple, Union, cast
 
 import torch
 from torch import nn, Tensor
@@ -14,7 +19,7 @@ from ..transforms._presets import ImageClassification, InterpolationMode
 from ..utils import _log_api_usage_once
 from ._api import WeightsEnum, Weights
 from ._meta import _IMAGENET_CATEGORIES
-from ._utils import handle_legacy_interface, _ovewrite_named_param, _make_divisible
+from ._utils import handle_legacy_interface, _ovewrite_value_param, _make_divisible
 
 
 __all__ = [
@@ -239,6 +244,7 @@ class EfficientNet(nn.Module):
         num_classes: int = 1000,
         norm_layer: Optional[Callable[..., nn.Module]] = None,
         last_channel: Optional[int] = None,
+        init_weights: bool = True,
         **kwargs: Any,
     ) -> None:
         """
@@ -251,6 +257,8 @@ class EfficientNet(nn.Module):
             num_classes (int): Number of classes
             norm_layer (Optional[Callable[..., nn.Module]]): Module specifying the normalization layer to use
             last_channel (int): The number of channels on the penultimate layer
+            init_weights (bool): If True, initializes the weights of the model. Can be disabled when the weights are
+                overwritten right after construction, e.g. by loading a checkpoint
         """
         super().__init__()
         _log_api_usage_once(self)
@@ -328,18 +336,19 @@ class EfficientNet(nn.Module):
             nn.Linear(lastconv_output_channels, num_classes),
         )
 
-        for m in self.modules():
-            if isinstance(m, nn.Conv2d):
-                nn.init.kaiming_normal_(m.weight, mode="fan_out")
-                if m.bias is not None:
+        if init_weights:
+            for m in self.modules():
+                if isinstance(m, nn.Conv2d):
+                    nn.init.kaiming_normal_(m.weight, mode="fan_out")
+                    if m.bias is not None:
+                        nn.init.zeros_(m.bias)
+                elif isinstance(m, (nn.BatchNorm2d, nn.GroupNorm)):
+                    nn.init.ones_(m.weight)
+                    nn.init.zeros_(m.bias)
+                elif isinstance(m, nn.Linear):
+                    init_range = 1.0 / math.sqrt(m.out_features)
+                    nn.init.uniform_(m.weight, -init_range, init_range)
                     nn.init.zeros_(m.bias)
-            elif isinstance(m, (nn.BatchNorm2d, nn.GroupNorm)):
-                nn.init.ones_(m.weight)
-                nn.init.zeros_(m.bias)
-            elif isinstance(m, nn.Linear):
-                init_range = 1.0 / math.sqrt(m.out_features)
-                nn.init.uniform_(m.weight, -init_range, init_range)
-                nn.init.zeros_(m.bias)
 
     def _forward_impl(self, x: Tensor) -> Tensor:
         x = self.features(x)
@@ -355,32 +364,182 @@ class EfficientNet(nn.Module):
         return self._forward_impl(x)
 
 
+_io_pool: Optional[ThreadPoolExecutor] = None
+_io_pool_lock = threading.Lock()
+
+
+def _get_io_pool() -> ThreadPoolExecutor:
+    global _io_pool
+    with _io_pool_lock:
+        if _io_pool is None:
+            _io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="efficientnet_io")
+        return _io_pool
+
+
+def _reset_io_pool() -> None:
+    # The worker thread of the executor doesn't survive a fork, but the executor still believes it is running. The
+    # child thus needs a fresh executor, and a fresh lock since the parent might have held it while forking.
+    global _io_pool, _io_pool_lock
+    _io_pool = None
+    _io_pool_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_io_pool)
+
+
 def _efficientnet(
     inverted_residual_setting: Sequence[Union[MBConvConfig, FusedMBConvConfig]],
     dropout: float,
     last_channel: Optional[int],
     weights: Optional[WeightsEnum],
     progress: bool,
+    *,
+    state_dict: Optional[Mapping[str, Any]] = None,
+    num_classes: Optional[int] = None,
+    norm_layer: Optional[Callable[..., nn.Module]] = None,
+    init_weights: Optional[bool] = None,
+    device: Optional[torch.device] = None,
+    dtype: Optional[torch.dtype] = None,
+    memory_format: torch.memory_format = torch.contiguous_format,
+    quantize: bool = False,
+    calibration_data: Optional[Tensor] = None,
+    for_inference: bool = False,
+    scripted: bool = False,
+    compile: Union[bool, str] = False,
     **kwargs: Any,
 ) -> EfficientNet:
-    if weights is not None:
-        _ovewrite_named_param(kwargs, "num_classes", len(weights.meta["categories"]))
+    """
+    Builds an EfficientNet from its configuration and optionally loads and optimizes it.
 
-    model = EfficientNet(inverted_residual_setting, dropout, last_channel=last_channel, **kwargs)
+    Args:
+        state_dict (Mapping, optional): An already loaded checkpoint, used instead of downloading ``weights``
+        device (torch.device, optional): The device the model is moved to before the weights are loaded
+        dtype (torch.dtype, optional): The dtype the model is cast to
+        memory_format (torch.memory_format): The memory format of the model, e.g. ``torch.channels_last``
+        quantize (bool): If True, quantizes the model to int8 after calibrating it on ``calibration_data``
+        for_inference (bool): If True, returns the model in eval mode with gradients disabled
+        scripted (bool): If True, returns the model scripted and frozen as a ``torch.jit.ScriptModule``
+        compile (bool or str): If set, wraps the model with ``torch.compile``, using the given mode when a string is
+            passed. The compilation happens on the first forward pass, which is therefore much slower.
+
+    The quantized, scripted and compiled models are a ``GraphModule``, a ``ScriptModule`` and an ``OptimizedModule``
+    respectively. They are called like an ``EfficientNet``, but don't necessarily expose all of its submodules.
+    """
+    if compile and not hasattr(torch, "compile"):
+        raise RuntimeError("The parameter 'compile' requires a PyTorch version that provides torch.compile.")
+    if quantize:
+        if calibration_data is None:
+            raise ValueError("The parameter 'calibration_data' is required to quantize the model.")
+        if device is not None or dtype is not None:
+            raise ValueError("The parameters 'device' and 'dtype' can't be set for quantized models.")
+    if scripted and compile:
+        raise ValueError("The parameters 'scripted' and 'compile' can't be used together.")
 
     if weights is not None:
-        model.load_state_dict(weights.get_state_dict(progress=progress))
-
-    return model
+        num_classes = _ovewrite_value_param(num_classes, len(weights.meta["categories"]))
+    if weights is not None or state_dict is not None:
+        # all parameters are overwritten by the checkpoint, so initializing them would be wasted work
+        init_weights = False
+
+    state_dict_future: Optional[Future] = None
+    if weights is not None and state_dict is None:
+        # fetch the checkpoint in the background while the model is being constructed
+        state_dict_future = _get_io_pool().submit(weights.get_state_dict, progress=progress, map_location=device)
+
+    try:
+        model: nn.Module = EfficientNet(
+            inverted_residual_setting,
+            dropout,
+            num_classes=num_classes if num_classes is not None else 1000,
+            norm_layer=norm_layer,
+            last_channel=last_channel,
+            init_weights=init_weights if init_weights is not None else True,
+            **kwargs,
+        )
+    except BaseException:
+        if state_dict_future is not None and not state_dict_future.cancel():
+            # The download already started. Don't wait for it, and drop its result so that a failing download doesn't
+            # hide the actual error.
+            state_dict_future.add_done_callback(lambda future: future.exception())
+        raise
+
+    if device is not None:
+        # move the model before loading, so that the checkpoint is mapped directly on the device and no second copy
+        # of the weights is kept in host memory
+        model = model.to(device=device)
+
+    if state_dict_future is not None:
+        state_dict = state_dict_future.result()
+    if state_dict is not None:
+        model.load_state_dict(state_dict, strict=True)
+
+    if quantize:
+        # checked on entry, before the model is constructed
+        assert calibration_data is not None
+        model = _quantize_fx(model, calibration_data, "fbgemm")
+
+    if dtype is not None or memory_format != torch.contiguous_format:
+        # cast and convert all parameters and buffers in a single pass
+        model = model.to(dtype=dtype, memory_format=memory_format)
+
+    if for_inference:
+        # no autograd bookkeeping is needed on the parameters if the model is never trained
+        model.eval()
+        model.requires_grad_(False)
+
+    if scripted:
+        # freezing inlines the parameters and folds the BatchNorm layers into the preceding convolutions
+        model = torch.jit.freeze(torch.jit.script(model.eval()))
+
+    if compile:
+        # The compilation happens lazily, so the first forward pass incurs the compilation latency
+        mode = compile if isinstance(compile, str) else "reduce-overhead"
+        model = torch.compile(model, mode=mode)  # type: ignore[attr-defined]
+
+    return cast(EfficientNet, model)
+
+
+def _quantize_fx(model: nn.Module, calibration_data: Tensor, backend: str) -> nn.Module:
+    from torch.ao.quantization.quantize_fx import convert_fx, prepare_fx
+
+    if backend not in torch.backends.quantized.supported_engines:
+        raise RuntimeError("Quantized backend not supported")
+    torch.backends.quantized.engine = backend
+    model.eval()
+    qconfig_dict = {"": torch.ao.quantization.get_default_qconfig(backend)}
+    # Only newer PyTorch versions require example inputs to trace the model
+    if "example_inputs" in inspect.signature(prepare_fx).parameters:
+        prepared = prepare_fx(model, qconfig_dict, example_inputs=(calibration_data,))
+    else:
+        prepared = prepare_fx(model, qconfig_dict)
+    with torch.no_grad():
+        prepared(calibration_data)
+    return convert_fx(prepared)
 
 
 def _efficientnet_conf(
     arch: str,
     **kwargs: Any,
+) -> Tuple[Sequence[Union[MBConvConfig, FusedMBConvConfig]], Optional[int]]:
+    inverted_residual_setting, last_channel = _cached_efficientnet_conf(
+        arch, kwargs.pop("width_mult", None), kwargs.pop("depth_mult", None)
+    )
+    # copy to avoid modifications of the cached configs. shallow copy is enough
+    return [copy.copy(cnf) for cnf in inverted_residual_setting], last_channel
+
+
+@lru_cache(maxsize=None)
+def _cached_efficientnet_conf(
+    arch: str,
+    width_mult: Optional[float],
+    depth_mult: Optional[float],
 ) -> Tuple[Sequence[Union[MBConvConfig, FusedMBConvConfig]], Optional[int]]:
     inverted_residual_setting: Sequence[Union[MBConvConfig, FusedMBConvConfig]]
     if arch.startswith("efficientnet_b"):
-        bneck_conf = partial(MBConvConfig, width_mult=kwargs.pop("width_mult"), depth_mult=kwargs.pop("depth_mult"))
+        if width_mult is None or depth_mult is None:
+            raise ValueError(f"The parameters 'width_mult' and 'depth_mult' are required for {arch}")
+        bneck_conf = partial(MBConvConfig, width_mult=width_mult, depth_mult=depth_mult)
         inverted_residual_setting = [
             bneck_conf(1, 3, 1, 32, 16, 1),
             bneck_conf(6, 3, 2, 16, 24, 2),
@@ -429,29 +588,40 @@ def _efficientnet_conf(
     return inverted_residual_setting, last_channel
 
 
-_COMMON_META = {
-    "task": "image_classification",
-    "categories": _IMAGENET_CATEGORIES,
-    "recipe": "https://github.com/pytorch/vision/tree/main/references/classification#efficientnet",
-}
+# The B5-B7 and V2 checkpoints were trained with the TensorFlow BatchNorm defaults. The partials are shared across the
+# builders since they are stateless.
+_TF_BATCH_NORM_V1 = partial(nn.BatchNorm2d, eps=0.001, momentum=0.01)
+_TF_BATCH_NORM_V2 = partial(nn.BatchNorm2d, eps=1e-03)
+
+
+# The meta-data of the weights are layered on top of the common ones instead of being copied into every entry.
+_COMMON_META = ChainMap(
+    {
+        "task": "image_classification",
+        "categories": _IMAGENET_CATEGORIES,
+        "recipe": "https://github.com/pytorch/vision/tree/main/references/classification#efficientnet",
+    }
+)
 
 
-_COMMON_META_V1 = {
-    **_COMMON_META,
-    "architecture": "EfficientNet",
-    "publication_year": 2019,
-    "interpolation": InterpolationMode.BICUBIC,
-    "min_size": (1, 1),
-}
+_COMMON_META_V1 = _COMMON_META.new_child(
+    {
+        "architecture": "EfficientNet",
+        "publication_year": 2019,
+        "interpolation": InterpolationMode.BICUBIC,
+        "min_size": (1, 1),
+    }
+)
 
 
-_COMMON_META_V2 = {
-    **_COMMON_META,
-    "architecture": "EfficientNetV2",
-    "publication_year": 2021,
-    "interpolation": InterpolationMode.BILINEAR,
-    "min_size": (33, 33),
-}
+_COMMON_META_V2 = _COMMON_META.new_child(
+    {
+        "architecture": "EfficientNetV2",
+        "publication_year": 2021,
+        "interpolation": InterpolationMode.BILINEAR,
+        "min_size": (33, 33),
+    }
+)
 
 
 class EfficientNet_B0_Weights(WeightsEnum):
@@ -460,13 +630,14 @@ class EfficientNet_B0_Weights(WeightsEnum):
         transforms=partial(
             ImageClassification, crop_size=224, resize_size=256, interpolation=InterpolationMode.BICUBIC
         ),
-        meta={
-            **_COMMON_META_V1,
-            "num_params": 5288548,
-            "size": (224, 224),
-            "acc@1": 77.692,
-            "acc@5": 93.532,
-        },
+        meta=_COMMON_META_V1.new_child(
+            {
+                "num_params": 5288548,
+                "size": (224, 224),
+                "acc@1": 77.692,
+                "acc@5": 93.532,
+            }
+        ),
     )
     DEFAULT = IMAGENET1K_V1
 
@@ -477,28 +648,30 @@ class EfficientNet_B1_Weights(WeightsEnum):
         transforms=partial(
             ImageClassification, crop_size=240, resize_size=256, interpolation=InterpolationMode.BICUBIC
         ),
-        meta={
-            **_COMMON_META_V1,
-            "num_params": 7794184,
-            "size": (240, 240),
-            "acc@1": 78.642,
-            "acc@5": 94.186,
-        },
+        meta=_COMMON_META_V1.new_child(
+            {
+                "num_params": 7794184,
+                "size": (240, 240),
+                "acc@1": 78.642,
+                "acc@5": 94.186,
+            }
+        ),
     )
     IMAGENET1K_V2 = Weights(
         url="https://download.pytorch.org/models/efficientnet_b1-c27df63c.pth",
         transforms=partial(
             ImageClassification, crop_size=240, resize_size=255, interpolation=InterpolationMode.BILINEAR
         ),
-        meta={
-            **_COMMON_META_V1,
-            "num_params": 7794184,
-            "recipe": "https://github.com/pytorch/vision/issues/3995#new-recipe-with-lr-wd-crop-tuning",
-            "interpolation": InterpolationMode.BILINEAR,
-            "size": (240, 240),
-            "acc@1": 79.838,
-            "acc@5": 94.934,
-        },
+        meta=_COMMON_META_V1.new_child(
+            {
+                "num_params": 7794184,
+                "recipe": "https://github.com/pytorch/vision/issues/3995#new-recipe-with-lr-wd-crop-tuning",
+                "interpolation": InterpolationMode.BILINEAR,
+                "size": (240, 240),
+                "acc@1": 79.838,
+                "acc@5": 94.934,
+            }
+        ),
     )
     DEFAULT = IMAGENET1K_V2
 
@@ -509,13 +682,14 @@ class EfficientNet_B2_Weights(WeightsEnum):
         transforms=partial(
             ImageClassification, crop_size=288, resize_size=288, interpolation=InterpolationMode.BICUBIC
         ),
-        meta={
-            **_COMMON_META_V1,
-            "num_params": 9109994,
-            "size": (288, 288),
-            "acc@1": 80.608,
-            "acc@5": 95.310,
-        },
+        meta=_COMMON_META_V1.new_child(
+            {
+                "num_params": 9109994,
+                "size": (288, 288),
+                "acc@1": 80.608,
+                "acc@5": 95.310,
+            }
+        ),
     )
     DEFAULT = IMAGENET1K_V1
 
@@ -526,13 +700,14 @@ class EfficientNet_B3_Weights(WeightsEnum):
         transforms=partial(
             ImageClassification, crop_size=300, resize_size=320, interpolation=InterpolationMode.BICUBIC
         ),
-        meta={
-            **_COMMON_META_V1,
-            "num_params": 12233232,
-            "size": (300, 300),
-            "acc@1": 82.008,
-            "acc@5": 96.054,
-        },
+        meta=_COMMON_META_V1.new_child(
+            {
+                "num_params": 12233232,
+                "size": (300, 300),
+                "acc@1": 82.008,
+                "acc@5": 96.054,
+            }
+        ),
     )
     DEFAULT = IMAGENET1K_V1
 
@@ -543,13 +718,14 @@ class EfficientNet_B4_Weights(WeightsEnum):
         transforms=partial(
             ImageClassification, crop_size=380, resize_size=384, interpolation=InterpolationMode.BICUBIC
         ),
-        meta={
-            **_COMMON_META_V1,
-            "num_params": 19341616,
-            "size": (380, 380),
-            "acc@1": 83.384,
-            "acc@5": 96.594,
-        },
+        meta=_COMMON_META_V1.new_child(
+            {
+                "num_params": 19341616,
+                "size": (380, 380),
+                "acc@1": 83.384,
+                "acc@5": 96.594,
+            }
+        ),
     )
     DEFAULT = IMAGENET1K_V1
 
@@ -560,13 +736,14 @@ class EfficientNet_B5_Weights(WeightsEnum):
         transforms=partial(
             ImageClassification, crop_size=456, resize_size=456, interpolation=InterpolationMode.BICUBIC
         ),
-        meta={
-            **_COMMON_META_V1,
-            "num_params": 30389784,
-            "size": (456, 456),
-            "acc@1": 83.444,
-            "acc@5": 96.628,
-        },
+        meta=_COMMON_META_V1.new_child(
+            {
+                "num_params": 30389784,
+                "size": (456, 456),
+                "acc@1": 83.444,
+                "acc@5": 96.628,
+            }
+        ),
     )
     DEFAULT = IMAGENET1K_V1
 
@@ -577,13 +754,14 @@ class EfficientNet_B6_Weights(WeightsEnum):
         transforms=partial(
             ImageClassification, crop_size=528, resize_size=528, interpolation=InterpolationMode.BICUBIC
         ),
-        meta={
-            **_COMMON_META_V1,
-            "num_params": 43040704,
-            "size": (528, 528),
-            "acc@1": 84.008,
-            "acc@5": 96.916,
-        },
+        meta=_COMMON_META_V1.new_child(
+            {
+                "num_params": 43040704,
+                "size": (528, 528),
+                "acc@1": 84.008,
+                "acc@5": 96.916,
+            }
+        ),
     )
     DEFAULT = IMAGENET1K_V1
 
@@ -594,13 +772,14 @@ class EfficientNet_B7_Weights(WeightsEnum):
         transforms=partial(
             ImageClassification, crop_size=600, resize_size=600, interpolation=InterpolationMode.BICUBIC
         ),
-        meta={
-            **_COMMON_META_V1,
-            "num_params": 66347960,
-            "size": (600, 600),
-            "acc@1": 84.122,
-            "acc@5": 96.908,
-        },
+        meta=_COMMON_META_V1.new_child(
+            {
+                "num_params": 66347960,
+                "size": (600, 600),
+                "acc@1": 84.122,
+                "acc@5": 96.908,
+            }
+        ),
     )
     DEFAULT = IMAGENET1K_V1
 
@@ -614,13 +793,14 @@ class EfficientNet_V2_S_Weights(WeightsEnum):
             resize_size=384,
             interpolation=InterpolationMode.BILINEAR,
         ),
-        meta={
-            **_COMMON_META_V2,
-            "num_params": 21458488,
-            "size": (384, 384),
-            "acc@1": 84.228,
-            "acc@5": 96.878,
-        },
+        meta=_COMMON_META_V2.new_child(
+            {
+                "num_params": 21458488,
+                "size": (384, 384),
+                "acc@1": 84.228,
+                "acc@5": 96.878,
+            }
+        ),
     )
     DEFAULT = IMAGENET1K_V1
 
@@ -634,13 +814,14 @@ class EfficientNet_V2_M_Weights(WeightsEnum):
             resize_size=480,
             interpolation=InterpolationMode.BILINEAR,
         ),
-        meta={
-            **_COMMON_META_V2,
-            "num_params": 54139356,
-            "size": (480, 480),
-            "acc@1": 85.112,
-            "acc@5": 97.156,
-        },
+        meta=_COMMON_META_V2.new_child(
+            {
+                "num_params": 54139356,
+                "size": (480, 480),
+                "acc@1": 85.112,
+                "acc@5": 97.156,
+            }
+        ),
     )
     DEFAULT = IMAGENET1K_V1
 
@@ -656,13 +837,14 @@ class EfficientNet_V2_L_Weights(WeightsEnum):
             mean=(0.5, 0.5, 0.5),
             std=(0.5, 0.5, 0.5),
         ),
-        meta={
-            **_COMMON_META_V2,
-            "num_params": 118515272,
-            "size": (480, 480),
-            "acc@1": 85.808,
-            "acc@5": 97.788,
-        },
+        meta=_COMMON_META_V2.new_child(
+            {
+                "num_params": 118515272,
+                "size": (480, 480),
+                "acc@1": 85.808,
+                "acc@5": 97.788,
+            }
+        ),
     )
     DEFAULT = IMAGENET1K_V1
 
@@ -678,6 +860,7 @@ def efficientnet_b0(
     Args:
         weights (EfficientNet_B0_Weights, optional): The pretrained weights for the model
         progress (bool): If True, displays a progress bar of the download to stderr
+        **kwargs: parameters passed to the ``EfficientNet`` base class and the building options of ``_efficientnet``
     """
     weights = EfficientNet_B0_Weights.verify(weights)
 
@@ -696,6 +879,7 @@ def efficientnet_b1(
     Args:
         weights (EfficientNet_B1_Weights, optional): The pretrained weights for the model
         progress (bool): If True, displays a progress bar of the download to stderr
+        **kwargs: parameters passed to the ``EfficientNet`` base class and the building options of ``_efficientnet``
     """
     weights = EfficientNet_B1_Weights.verify(weights)
 
@@ -714,6 +898,7 @@ def efficientnet_b2(
     Args:
         weights (EfficientNet_B2_Weights, optional): The pretrained weights for the model
         progress (bool): If True, displays a progress bar of the download to stderr
+        **kwargs: parameters passed to the ``EfficientNet`` base class and the building options of ``_efficientnet``
     """
     weights = EfficientNet_B2_Weights.verify(weights)
 
@@ -732,6 +917,7 @@ def efficientnet_b3(
     Args:
         weights (EfficientNet_B3_Weights, optional): The pretrained weights for the model
         progress (bool): If True, displays a progress bar of the download to stderr
+        **kwargs: parameters passed to the ``EfficientNet`` base class and the building options of ``_efficientnet``
     """
     weights = EfficientNet_B3_Weights.verify(weights)
 
@@ -750,6 +936,7 @@ def efficientnet_b4(
     Args:
         weights (EfficientNet_B4_Weights, optional): The pretrained weights for the model
         progress (bool): If True, displays a progress bar of the download to stderr
+        **kwargs: parameters passed to the ``EfficientNet`` base class and the building options of ``_efficientnet``
     """
     weights = EfficientNet_B4_Weights.verify(weights)
 
@@ -768,6 +955,7 @@ def efficientnet_b5(
     Args:
         weights (EfficientNet_B5_Weights, optional): The pretrained weights for the model
         progress (bool): If True, displays a progress bar of the download to stderr
+        **kwargs: parameters passed to the ``EfficientNet`` base class and the building options of ``_efficientnet``
     """
     weights = EfficientNet_B5_Weights.verify(weights)
 
@@ -778,7 +966,7 @@ def efficientnet_b5(
         last_channel,
         weights,
         progress,
-        norm_layer=partial(nn.BatchNorm2d, eps=0.001, momentum=0.01),
+        norm_layer=_TF_BATCH_NORM_V1,
         **kwargs,
     )
 
@@ -794,6 +982,7 @@ def efficientnet_b6(
     Args:
         weights (EfficientNet_B6_Weights, optional): The pretrained weights for the model
         progress (bool): If True, displays a progress bar of the download to stderr
+        **kwargs: parameters passed to the ``EfficientNet`` base class and the building options of ``_efficientnet``
     """
     weights = EfficientNet_B6_Weights.verify(weights)
 
@@ -804,7 +993,7 @@ def efficientnet_b6(
         last_channel,
         weights,
         progress,
-        norm_layer=partial(nn.BatchNorm2d, eps=0.001, momentum=0.01),
+        norm_layer=_TF_BATCH_NORM_V1,
         **kwargs,
     )
 
@@ -820,6 +1009,7 @@ def efficientnet_b7(
     Args:
         weights (EfficientNet_B7_Weights, optional): The pretrained weights for the model
         progress (bool): If True, displays a progress bar of the download to stderr
+        **kwargs: parameters passed to the ``EfficientNet`` base class and the building options of ``_efficientnet``
     """
     weights = EfficientNet_B7_Weights.verify(weights)
 
@@ -830,7 +1020,7 @@ def efficientnet_b7(
         last_channel,
         weights,
         progress,
-        norm_layer=partial(nn.BatchNorm2d, eps=0.001, momentum=0.01),
+        norm_layer=_TF_BATCH_NORM_V1,
         **kwargs,
     )
 
@@ -846,6 +1036,7 @@ def efficientnet_v2_s(
     Args:
         weights (EfficientNet_V2_S_Weights, optional): The pretrained weights for the model
         progress (bool): If True, displays a progress bar of the download to stderr
+        **kwargs: parameters passed to the ``EfficientNet`` base class and the building options of ``_efficientnet``
     """
     weights = EfficientNet_V2_S_Weights.verify(weights)
 
@@ -856,7 +1047,7 @@ def efficientnet_v2_s(
         last_channel,
         weights,
         progress,
-        norm_layer=partial(nn.BatchNorm2d, eps=1e-03),
+        norm_layer=_TF_BATCH_NORM_V2,
         **kwargs,
     )
 
@@ -872,6 +1063,7 @@ def efficientnet_v2_m(
     Args:
         weights (EfficientNet_V2_M_Weights, optional): The pretrained weights for the model
         progress (bool): If True, displays a progress bar of the download to stderr
+        **kwargs: parameters passed to the ``EfficientNet`` base class and the building options of ``_efficientnet``
     """
     weights = EfficientNet_V2_M_Weights.verify(weights)
 
@@ -882,7 +1074,7 @@ def efficientnet_v2_m(
         last_channel,
         weights,
         progress,
-        norm_layer=partial(nn.BatchNorm2d, eps=1e-03),
+        norm_layer=_TF_BATCH_NORM_V2,
         **kwargs,
     )
 
@@ -898,6 +1090,7 @@ def efficientnet_v2_l(
     Args:
         weights (EfficientNet_V2_L_Weights, optional): The pretrained weights for the model
         progress (bool): If True, displays a progress bar of the download to stderr
+        **kwargs: parameters passed to the ``EfficientNet`` base class and the building options of ``_efficientnet``
     """
     weights = EfficientNet_V2_L_Weights.verify(weights)
 
@@ -908,6 +1101,6 @@ def efficientnet_v2_l(
         last_channel,
         weights,
         progress,
-        norm_layer=partial(nn.BatchNorm2d, eps=1e-03),
+        norm_layer=_TF_BATCH_NORM_V2,
         **kwargs,
     )
@@ -48,8 +48,11 @@ class ImageClassification(nn.Module):
         img = F.center_crop(img, self._crop_size)
         if not isinstance(img, Tensor):
             img = F.pil_to_tensor(img)
+        # Resizing and cropping above operate on the original (typically uint8) image. If the conversion creates a new
+        # float tensor, it is owned by the preset and can be normalized in-place.
+        owns_img = img.dtype != torch.float
         img = F.convert_image_dtype(img, torch.float)
-        img = F.normalize(img, mean=self._mean, std=self._std)
+        img = F.normalize(img, mean=self._mean, std=self._std, inplace=owns_img)
         return img
 
 